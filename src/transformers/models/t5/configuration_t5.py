@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """ T5 model configuration"""
+import sys
 from typing import Mapping
 
 from ...configuration_utils import PretrainedConfig
@@ -30,6 +31,21 @@ T5_PRETRAINED_CONFIG_ARCHIVE_MAP = {
     "t5-11b": "https://huggingface.co/t5-11b/resolve/main/config.json",
 }
 
+# Maps the known `feed_forward_proj` values to `(dense_act_fn, is_gated_act)` so that the common
+# cases resolve with a single dict lookup in `__init__` instead of splitting and validating the
+# string on every instantiation. Unknown values fall back to the generic parsing below.
+_FFN_PROJ_TABLE = {
+    "relu": ("relu", False),
+    "gelu": ("gelu", False),
+    "gelu_new": ("gelu_new", False),
+    "silu": ("silu", False),
+    "gated-relu": ("relu", True),
+    "gated-silu": ("silu", True),
+    "gated-gelu_new": ("gelu_new", True),
+    # for backwards compatibility, `gated-gelu` maps to the `gelu_new` activation
+    "gated-gelu": ("gelu_new", True),
+}
+
 
 class T5Config(PretrainedConfig):
     r"""
@@ -106,7 +122,7 @@ class T5Config(PretrainedConfig):
         self.d_ff = d_ff
         self.num_layers = num_layers
         self.num_decoder_layers = (
-            num_decoder_layers if num_decoder_layers is not None else self.num_layers
+            num_decoder_layers if num_decoder_layers is not None else num_layers
         )  # default = symmetry
         self.num_heads = num_heads
         self.relative_attention_num_buckets = relative_attention_num_buckets
@@ -114,23 +130,24 @@ class T5Config(PretrainedConfig):
         self.dropout_rate = dropout_rate
         self.layer_norm_epsilon = layer_norm_epsilon
         self.initializer_factor = initializer_factor
-        self.feed_forward_proj = feed_forward_proj
+        # intern the activation strings so downstream equality checks against literals
+        # short-circuit on identity
+        self.feed_forward_proj = sys.intern(feed_forward_proj)
         self.use_cache = use_cache
 
-        act_info = self.feed_forward_proj.split("-")
-        self.dense_act_fn = act_info[-1]
-        self.is_gated_act = act_info[0] == "gated"
-
-        if len(act_info) > 1 and act_info[0] != "gated" or len(act_info) > 2:
-            raise ValueError(
-                f"`feed_forward_proj`: {feed_forward_proj} is not a valid activation function of the dense layer."
-                "Please make sure `feed_forward_proj` is of the format `gated-{ACT_FN}` or `{ACT_FN}`, e.g. "
-                "'gated-gelu' or 'relu'"
-            )
-
-        # for backwards compatibility
-        if feed_forward_proj == "gated-gelu":
-            self.dense_act_fn = "gelu_new"
+        ffn_info = _FFN_PROJ_TABLE.get(feed_forward_proj)
+        if ffn_info is not None:
+            self.dense_act_fn, self.is_gated_act = ffn_info
+        else:
+            act_info = self.feed_forward_proj.split("-")
+            if len(act_info) > 2 or (len(act_info) == 2 and act_info[0] != "gated"):
+                raise ValueError(
+                    f"`feed_forward_proj`: {feed_forward_proj} is not a valid activation function of the dense layer."
+                    "Please make sure `feed_forward_proj` is of the format `gated-{ACT_FN}` or `{ACT_FN}`, e.g. "
+                    "'gated-gelu' or 'relu'"
+                )
+            self.dense_act_fn = sys.intern(act_info[-1])
+            self.is_gated_act = act_info[0] == "gated"
 
         super().__init__(
             pad_token_id=pad_token_id,